@@ -40,12 +40,14 @@ setup(
     platforms='any',
     install_requires=[
         'pyenchant>=1.6.7',
-        'Pygments>=2.0.2',
+        'Pygments>=2.2',
         'colorama>=0.3.3',
         'python-magic>=0.4.12'
     ],
     classifiers=[
         'Programming Language :: Python',
+        'Programming Language :: Python :: Implementation :: CPython',
+        'Programming Language :: Python :: Implementation :: PyPy',
         'Development Status :: 4 - Beta',
         'Environment :: Console',
         'Intended Audience :: Developers',
@@ -11,6 +11,7 @@ import argparse
 import bisect
 import re
 import fnmatch
+import multiprocessing
 import pkg_resources
 from collections import OrderedDict
 
@@ -18,7 +19,6 @@ import enchant
 from enchant.tokenize import get_tokenizer, URLFilter, WikiWordFilter, Filter
 import pygments
 from pygments import lexers
-from pygments.filters import TokenMergeFilter
 from pygments.token import Comment, String, Token, Generic, Literal
 from colorama import Fore, Back, Style, init
 
@@ -53,6 +53,9 @@ else:  # POSIX platforms
 NAME = 'SourceSpell'
 DESCRIPTION = "%s - Command line spellchecker for source code files." % NAME
 
+# Format for printing errors, from a tuple of (filename, line_no, column, word).
+ERROR_FORMAT = "%s - Ln %s Col %s: %s"
+
 
 class EmptyFileError(Exception):
     """Error thrown for empty files."""
@@ -74,12 +77,10 @@ class HashBangFilter(Filter):
 
     Taken from: https://github.com/htgoebel/pysource-spellchecker
     """
-    _pattern = re.compile(r"^#!/.+$")
 
     def _skip(self, word):
-        if self._pattern.match(word):
-            return True
-        return False
+        # Cheaper than matching against the regular expression r"^#!/.+$".
+        return word.startswith('#!/') and len(word) > 3 and '\n' not in word
 
 
 class MyWikiWordFilter(WikiWordFilter):
@@ -97,6 +98,10 @@ class EmailFilter(enchant.tokenize.EmailFilter):
     """
     _pattern = re.compile(r"^.+@[^\.].*\.[a-z]{2,}\W?$")
 
+    def _skip(self, word):
+        # Only match the pattern against words that could be an address.
+        return '@' in word and self._pattern.match(word) is not None
+
 
 class SpellingCorrection(object):
     """Object to store information for a spelling
@@ -110,9 +115,12 @@ class SpellingCorrection(object):
     :param dictionary: Reference to the dictionary object.
     :type dictionary: :class:`enchant.Dict`
     :param line_content: The contents of the line containing the error.
+    :param suggest_cache: Optional :class:`dict` of previous suggestions, shared
+                          between errors.
     """
 
-    def __init__(self, filename, word, index, line_no, column, dictionary, line_content):
+    def __init__(self, filename, word, index, line_no, column, dictionary, line_content,
+                 suggest_cache=None):
         self.filename = filename
         self.word = word
         self.index = index
@@ -120,20 +128,21 @@ class SpellingCorrection(object):
         self.column = column
         self.dictionary = dictionary
         self.line_content = line_content.rstrip()
+        self._suggest_cache = {} if suggest_cache is None else suggest_cache
 
     def __str__(self):
         """Return a string representation of the error, including
         the filename, line and column numbers.
         """
-        return (
-            "%s - Ln %s Col %s: %s" %
-            (self.filename, self.line_no, self.column, self.word)
-        )
+        return ERROR_FORMAT % (self.filename, self.line_no, self.column, self.word)
 
     @property
     def suggestions(self):
         """The :class:`list` of suggested corrections."""
-        return self.dictionary.suggest(self.word)
+        suggestions = self._suggest_cache.get(self.word)
+        if suggestions is None:
+            suggestions = self._suggest_cache[self.word] = self.dictionary.suggest(self.word)
+        return suggestions
 
     def prompt(self):
         """Generate a prompt listing the available corrections.
@@ -149,10 +158,63 @@ class SpellingCorrection(object):
         )
 
 
+# Cache of dictionaries, keyed by language, project dictionary path and modification time.
+_dictionary_cache = {}
+
+# Shared mimetype detector, created on first use.
+_magic = None
+
+
+def get_dictionary(language, project_dict):
+    """Return the Enchant dictionary for the language and project dictionary.
+
+    Dictionaries are cached, so repeated checks in the same process only
+    load the dictionary once. The cache is refreshed if the project dictionary
+    has been modified.
+
+    :param language: ISO language code, e.g. 'en_GB' or 'en_US'
+    :param project_dict: Absolute path to the project dictionary.
+    :rtype: :class:`enchant.DictWithPWL`
+    """
+    try:
+        mtime = os.path.getmtime(project_dict)
+    except OSError:
+        mtime = None
+    key = (language, project_dict, mtime)
+    dictionary = _dictionary_cache.get(key)
+    if dictionary is None:
+        dictionary = _dictionary_cache[key] = enchant.DictWithPWL(language, project_dict)
+    return dictionary
+
+
+def _get_magic():
+    """Return the shared :class:`magic.Magic` instance for mimetype detection,
+    so the magic database is only loaded once.
+    """
+    global _magic
+    if _magic is None:
+        _magic = magic.Magic(mime=True)
+    return _magic
+
+
+def get_spelling_tokeniser(dictionary):
+    """Create the Enchant tokeniser used for splitting tokens into words.
+
+    :param dictionary: Enchant dictionary.
+    :type dictionary: :class:`enchant.Dict`
+    :rtype: :class:`enchant.tokenize.Tokenizer`
+    """
+    # TODO: Consider breaking apart WikiWords instead of filtering them out.
+    return get_tokenizer(
+        dictionary.tag, [EmailFilter, URLFilter, WikiWordFilter, HashBangFilter]
+    )
+
+
 def merge_tokens(stream):
     """Merge tokens of the same type from Pygments.
 
-    Adapted from :class:`pygments.filters.TokenMergeFilter`
+    Adapted from :class:`pygments.filters.TokenMergeFilter`, but keeps
+    the index of each token, which the filter discards.
     """
     (curr_type, curr_value, curr_index) = (None, None, None)
     for index, ttype, value in stream:
@@ -166,6 +228,137 @@ def merge_tokens(stream):
         yield (curr_index, curr_type, curr_value)
 
 
+# Cache of lexers, keyed by the lookup type and the filename, mimetype or lexer name.
+_lexer_cache = {}
+
+
+def _cached_lexer(lookup, key):
+    """Return a shared lexer instance from one of the Pygments lookup
+    functions, caching the result to avoid repeated searches of the
+    lexer registry.
+
+    :param lookup: One of :func:`_lexer_for_filename`,
+                   :func:`pygments.lexers.get_lexer_for_mimetype` or
+                   :func:`pygments.lexers.get_lexer_by_name`.
+    :param key: The argument to pass to the lookup function.
+    :returns: The lexer, or ``None`` if no lexer was found.
+    """
+    try:
+        return _lexer_cache[(lookup, key)]
+    except KeyError:
+        pass
+    try:
+        lexer = lookup(key)
+    except pygments.util.ClassNotFound:
+        lexer = None
+    _lexer_cache[(lookup, key)] = lexer
+    return lexer
+
+
+# Lexer instances, shared between all files using the same lexer class.
+_lexer_instances = {}
+
+
+def _lexer_for_filename(filename):
+    """Return a shared instance of the lexer class for the filename.
+
+    Unlike :func:`pygments.lexers.get_lexer_for_filename`, files
+    using the same lexer class share a single lexer instance.
+
+    :param filename: The file basename.
+    :raises pygments.util.ClassNotFound: If no lexer matches the filename.
+    """
+    lexer_class = lexers.find_lexer_class_for_filename(filename)
+    if lexer_class is None:
+        raise pygments.util.ClassNotFound("no lexer for filename %r found" % filename)
+    lexer = _lexer_instances.get(lexer_class)
+    if lexer is None:
+        lexer = _lexer_instances[lexer_class] = lexer_class()
+    return lexer
+
+
+# Lower case file extensions and compiled whole name patterns known to Pygments,
+# created on first use.
+_known_filenames = None
+
+_simple_pattern_re = re.compile(r'^\*(\.[^*?\[\]./\\]+)$')
+
+
+def _get_known_filenames():
+    """Return the filename patterns of all Pygments lexers.
+
+    :returns: A tuple of the set of lower case extensions from simple ``*.ext``
+              patterns, and a regular expression compiled from the remaining
+              patterns, or ``None`` if there are none.
+    """
+    global _known_filenames
+    if _known_filenames is None:
+        extensions = set()
+        patterns = []
+        for _, _, filenames, _ in lexers.get_all_lexers():
+            for pattern in filenames:
+                match = _simple_pattern_re.match(pattern)
+                if match is not None:
+                    extensions.add(match.group(1).lower())
+                else:
+                    patterns.append(pattern)
+        # Pygments matches filenames case-sensitively, so the patterns aren't normcased.
+        pattern_re = None
+        if patterns:
+            pattern_re = re.compile(
+                '|'.join('(?:%s)' % fnmatch.translate(pattern) for pattern in patterns)
+            )
+        _known_filenames = (extensions, pattern_re)
+    return _known_filenames
+
+
+def _has_known_lexer(filename):
+    """Return ``True`` if the filename may have a lexer, based on the filename
+    patterns of all Pygments lexers, ``False`` otherwise.
+
+    Files without an extension are always accepted since these are often
+    scripts, which can be detected from their contents. Extensions are compared
+    case-insensitively, so files such as ``FOO.PY`` are still checked using the
+    mimetype or contents.
+
+    :param filename: The file basename.
+    """
+    (extensions, pattern_re) = _get_known_filenames()
+    extension = os.path.splitext(filename)[1]
+    return (
+        not extension or
+        extension.lower() in extensions or
+        (pattern_re is not None and pattern_re.match(filename) is not None)
+    )
+
+
+def _get_lexer_for_filename(filename):
+    """Return the cached lexer for the filename.
+
+    Names that only match simple ``*.ext`` patterns share the cache entry for their
+    extension, so the lexer registry is only searched once per extension. Names
+    matching a whole name pattern, such as ``Makefile`` or ``CMakeLists.txt``, are
+    cached by name.
+
+    :param filename: The file basename.
+    :returns: The lexer, or ``None`` if no lexer matches the filename.
+    """
+    (_, pattern_re) = _get_known_filenames()
+    if pattern_re is not None and pattern_re.match(filename) is not None:
+        return _cached_lexer(_lexer_for_filename, filename)
+    extension = os.path.splitext(filename)[1]
+    if not extension:
+        return None
+    # A '*' never appears in the literal part of a Pygments pattern, so this
+    # only matches the simple patterns for the extension.
+    return _cached_lexer(_lexer_for_filename, '*' + extension)
+
+
+# Token categories used by :meth:`SourceFile._select_token`.
+_TEXT_TOKEN = object()
+_STRING_TOKEN = object()
+
+
 class SourceFile(object):
     """Interface for checking for spelling errors in a
     single source file.
@@ -177,64 +370,70 @@ class SourceFile(object):
     :type tokeniser: :class:`enchant.tokenize.Tokenizer`
     :param base_dir: Base directory path.
     :param encoding: Character set encoding to read files with.
+    :param check_cache: Optional :class:`dict` of previous dictionary lookups,
+                        shared between files.
+    :param suggest_cache: Optional :class:`dict` of previous suggestions,
+                          shared between files.
     """
 
-    _rawstring_re = re.compile(r'^r["\']')
+    # Matches any letter, values without any letters contain no words to check.
+    _letter_re = re.compile(r'[^\W\d_]', re.UNICODE)
+
+    _newline_re = re.compile('\n')
 
-    def __init__(self, filename, dictionary, tokeniser, base_dir, encoding='utf-8'):
+    # Map of token types to :data:`_TEXT_TOKEN`, :data:`_STRING_TOKEN` or ``None``.
+    _token_categories = {}
+
+    def __init__(self, filename, dictionary, tokeniser, base_dir, encoding='utf-8',
+                 check_cache=None, suggest_cache=None):
         self.base_dir = base_dir
         self.filename = filename
         self.dict = dictionary
-        # List of indexes of line endings for generating line numbers.
-        self.line_idxs = []
-        try:
-            with codecs.open(self.filename, 'r', encoding) as src_file:
-                self.content = src_file.read()
-                line_lengths = [len(line) for line in self.content.splitlines(True)]
-                if len(line_lengths) > 0:
-                    count = 0
-                    for length in line_lengths:
-                        self.line_idxs.append(length + count)
-                        count += length
-                else:
-                    raise EmptyFileError("%s: File empty." % self.relname)
-        except UnicodeDecodeError:
-            print(
-                "%s: Couldn't decode with '%s' codec." % (self.relname, encoding),
-                file=sys.stderr
-            )
-            raise
+        self._check_cache = {} if check_cache is None else check_cache
+        self._suggest_cache = {} if suggest_cache is None else suggest_cache
+        with open(self.filename, 'rb') as src_file:
+            raw_content = src_file.read()
+        # Decode in one step, rather than through a codecs stream reader.
+        self.content = raw_content.decode(encoding)
+        del raw_content
+
+        if not self.content:
+            raise EmptyFileError("%s: File empty." % self.relname)
+        self.line_idxs = self._get_line_idxs(self.content)
 
         self.code_lexer = self._get_lexer()
 
         self.tokeniser = tokeniser
 
+    @staticmethod
+    def _get_line_idxs(content):
+        """Find the indexes of the line endings in the content, for
+        generating line numbers.
+
+        :param content: The file contents.
+        :returns: The index following each newline, and the end of the content.
+        :rtype: :class:`list` of int
+        """
+        line_idxs = [match.end() for match in SourceFile._newline_re.finditer(content)]
+        if not line_idxs or line_idxs[-1] != len(content):
+            line_idxs.append(len(content))
+        return line_idxs
+
     def _get_lexer(self):
         """Initialise the Pygments lexer.
         """
         # TODO: Improve the lexer selection since Jinja and other template languages are
         # often saved with .html template.
-        lexer = None
-        try:
-            lexer = lexers.get_lexer_for_filename(self.filename)
-        except pygments.util.ClassNotFound:
-            pass
+        lexer = _get_lexer_for_filename(os.path.basename(self.filename))
 
         if magic is not None and lexer is None:
             # Fallback to mimetype detection
-            try:
-                mimetype = magic.from_file(self.filename, mime=True)
-                lexer = lexers.get_lexer_for_mimetype(mimetype)
-            except pygments.util.ClassNotFound:
-                pass
+            mimetype = _get_magic().from_file(self.filename)
+            lexer = _cached_lexer(lexers.get_lexer_for_mimetype, mimetype)
 
         if lexer is None:
-            try:
-                # If all else fails use the guess_lexer method
-                lexer = lexers.guess_lexer(self.content[:512])
-            except pygments.util.ClassNotFound:
-                print("No lexer found for: %s" % self.relname, file=sys.stderr)
-                raise
+            # If all else fails use the guess_lexer method
+            lexer = lexers.guess_lexer(self.content[:512])
 
         return lexer
 
@@ -258,39 +457,84 @@ class SourceFile(object):
         # Note: line and column numbers are 1-indexed
         return (line + 1, column + 1)
 
+    def _batch_index_to_col_lineno(self, indexes):
+        """Calculates the line and column indexes for a sorted
+        sequence of file indexes.
+
+        Each search starts from the line of the previous index, since
+        the indexes are sorted.
+
+        :param indexes: Sorted list of file indexes.
+        :returns: A list of line number and column index tuples.
+        :rtype: :class:`list` of :class:`tuple` of (int, int)
+        """
+        line_idxs = self.line_idxs
+        bisect_right = bisect.bisect_right
+        results = []
+        line = 0
+        for index in indexes:
+            line = bisect_right(line_idxs, index, line)
+            column = index if line == 0 else index - line_idxs[line - 1]
+            results.append((line + 1, column + 1))
+        return results
+
     def _filter_code_tokens(self, stream):
         """Filter the token stream based on token type and
         the name of the lexer.
         """
+        # Bind to locals as these are used for every token.
+        select_token = self._select_token
+        lexer_name = self.code_lexer.name
+        error_type = Token.Error
+        doc_type = String.Doc
         for index, tokentype, value in merge_tokens(stream):
             # Handle token errors
-            if tokentype is Token.Error:
+            if tokentype is error_type:
                 (line, _) = self._index_to_col_lineno(index)
                 raise ParseError('%s: Parse error at line %s.' % (self.relname, line))
             # Lex python doc strings with the reStructuredText lexer.
-            if tokentype is String.Doc and self.code_lexer.name == 'Python':
-                sub_lexer = lexers.get_lexer_by_name('reStructuredText')
+            if tokentype is doc_type and lexer_name == 'Python':
+                sub_lexer = _cached_lexer(lexers.get_lexer_by_name, 'reStructuredText')
                 sub_stream = merge_tokens(sub_lexer.get_tokens_unprocessed(value))
                 for sub_index, tktype, value in sub_stream:
-                    if self._select_token(tokentype, sub_lexer.name, value):
+                    if select_token(tokentype, sub_lexer.name, value):
                         yield (index + sub_index, value)
             else:
-                if self._select_token(tokentype, self.code_lexer.name, value):
+                if select_token(tokentype, lexer_name, value):
                     yield (index, value)
 
+    @classmethod
+    def _token_category(cls, tokentype):
+        """Return the category of the token type, caching the result
+        since checking the token hierarchy is relatively slow.
+        """
+        try:
+            return cls._token_categories[tokentype]
+        except KeyError:
+            pass
+        if ((tokentype in Comment and tokentype not in Comment.Preproc) or
+                (tokentype in Token.Text) or
+                (tokentype in Generic.Emph) or
+                (tokentype in Generic.Strong)):
+            category = _TEXT_TOKEN
+        elif tokentype in Literal.String:
+            category = _STRING_TOKEN
+        else:
+            category = None
+        cls._token_categories[tokentype] = category
+        return category
+
     def _select_token(self, tokentype, name, value):
         """Return ``True`` if the token should be used, ``False`` otherwise."""
         # TODO: Make min length configurable.
         MIN_LENGTH = 10
 
+        category = self._token_category(tokentype)
         return (
-            (tokentype in Comment and tokentype not in Comment.Preproc) or
-            (tokentype in Token.Text) or
-            (tokentype in Generic.Emph) or
-            (tokentype in Generic.Strong) or
+            category is _TEXT_TOKEN or
             # Ignore string literals in reStructuredText since
             # these are used class and function references.
-            (tokentype in Literal.String and
+            (category is _STRING_TOKEN and
              len(value) > MIN_LENGTH and
              name != 'reStructuredText' and not
              self._is_rawstring(value))  # Ignore Python raw-string literals
@@ -300,24 +544,112 @@ class SourceFile(object):
         """Return ``True`` if value is a Python raw-string literal,
         ``False`` otherwise.
         """
-        return self._rawstring_re.match(value) is not None
+        return value.startswith(('r"', "r'"))
+
+    def _check_many(self, words):
+        """Check the spelling of several words at once. Each distinct
+        word is only looked up once.
+
+        :param words: Iterable of words to check.
+        :returns: A map of each distinct word to the check result.
+        :rtype: :class:`dict`
+        """
+        cache = self._check_cache
+        check = self.dict.check
+        results = {}
+        for word in words:
+            if word in results:
+                continue
+            result = cache.get(word)
+            if result is None:
+                result = cache[word] = check(word)
+            results[word] = result
+        return results
+
+    def _misspelt_words(self):
+        """Generator that yields a tuple of (index, word, line_no, column)
+        for each spelling error in the current source file.
+        """
+        # Bind to locals as these are used for every token.
+        has_letter = self._letter_re.search
+        tokeniser = self.tokeniser
+        check_many = self._check_many
+        stream = self.code_lexer.get_tokens_unprocessed(self.content)
+        for index, value in self._filter_code_tokens(stream):
+            if has_letter(value) is None:
+                continue
+            words = list(tokeniser(value))
+            checked = check_many(word for word, _ in words)
+            if all(checked.values()):
+                continue
+            misspelt = [
+                (index + token_index, word) for word, token_index in words
+                if not checked[word]
+            ]
+            positions = self._batch_index_to_col_lineno([idx for idx, _ in misspelt])
+            for (word_index, word), (line, column) in zip(misspelt, positions):
+                yield (word_index, word, line, column)
 
     def errors(self):
         """Generator that yields :class:`SpellingCorrection` objects for the current
         source file.
         """
-        stream = self.code_lexer.get_tokens_unprocessed(self.content)
-        for index, value in self._filter_code_tokens(stream):
-            for word, token_index in self.tokeniser(value):
-                if not self.dict.check(word):
-                    line, column = self._index_to_col_lineno(index + token_index)
-                    # Get line content
-                    lo = 0 if line == 1 else self.line_idxs[line - 2]
-                    line_content = self.content[lo:self.line_idxs[line - 1]]
-                    yield SpellingCorrection(
-                        self.relname, word, index + token_index,
-                        line, column, self.dict, line_content
-                    )
+        content = self.content
+        line_idxs = self.line_idxs
+        relname = self.relname
+        check_cache = self._check_cache
+        for word_index, word, line, column in self._misspelt_words():
+            # The word may have been added to the dictionary since it was checked,
+            # in the interactive checker.
+            if check_cache.get(word):
+                continue
+            # Get line content
+            lo = 0 if line == 1 else line_idxs[line - 2]
+            line_content = content[lo:line_idxs[line - 1]]
+            yield SpellingCorrection(
+                relname, word, word_index,
+                line, column, self.dict, line_content, self._suggest_cache
+            )
+
+    def errors_lite(self):
+        """Generator that yields a tuple of (filename, line_no, column, word) for
+        each spelling error in the current source file.
+
+        Cheaper than :meth:`errors` when only the location of each error is needed.
+        """
+        relname = self.relname
+        for _, word, line, column in self._misspelt_words():
+            yield (relname, line, column, word)
+
+
+def check_source_file(process, filename, dictionary, tokeniser, base_dir, encoding='utf-8',
+                      check_cache=None, suggest_cache=None):
+    """Open a :class:`SourceFile` and pass it to ``process``, handling the
+    errors common to all checkers.
+
+    Error messages are returned rather than printed, so that the caller
+    controls the order of the output.
+
+    :param process: Callable taking the :class:`SourceFile` to check.
+    :param filename: Absolute path to the file.
+    :returns: A tuple of the return code, and an error message to print or ``None``.
+    :raises StopIteration: If the user quits the interactive checker.
+    """
+    relname = filename[len(base_dir) + 1:]
+    try:
+        process(
+            SourceFile(filename, dictionary, tokeniser, base_dir, encoding,
+                       check_cache, suggest_cache)
+        )
+    except pygments.util.ClassNotFound:
+        return (1, "No lexer found for: %s" % relname)
+    except ParseError as e:
+        return (1, str(e))
+    except UnicodeDecodeError:
+        return (1, "%s: Couldn't decode with '%s' codec." % (relname, encoding))
+    except (EmptyFileError, NextFile):
+        pass  # Skip empty files
+    return (0, None)
 
 
 class BaseChecker(object):
@@ -328,10 +660,12 @@ class BaseChecker(object):
     :param language: ISO language code, e.g. 'en_GB' or 'en_US'
     :param project_dict: Path to the project dictionary for excluded words.
     :param encoding: Character set encoding to use reading / writing files.
+    :param force_guess: Check files with an extension unknown to Pygments, by guessing
+                        the lexer from the mimetype or file contents.
     """
 
     def __init__(self, base_dir='.', ignore_patterns=None, language='en_GB',
-                 project_dict=None, encoding='utf-8'):
+                 project_dict=None, encoding='utf-8', force_guess=False):
         self.base_dir = os.path.realpath(base_dir)
         # Ignore common binary file formats and hidden files
         self.ignore_patterns = [
@@ -346,21 +680,54 @@ class BaseChecker(object):
             self.ignore_patterns.extend(
                 [os.path.join(self.base_dir, pattern) for pattern in ignore_patterns]
             )
-        self.dictionary = enchant.DictWithPWL(language, project_dict)
+        self._ignore_re = self._compile_patterns(self.ignore_patterns)
+        # A directory matching a pattern ending with '*' will also match everything
+        # below it, since the wildcard matches path separators.
+        self._ignore_dir_re = self._compile_patterns(
+            [pattern for pattern in self.ignore_patterns if pattern.endswith('*')]
+        )
+        self.language = language
+        self.project_dict = project_dict
+        self.dictionary = get_dictionary(language, project_dict)
         self.ret_code = 0
         self.encoding = encoding
+        self.force_guess = force_guess
+        # Cache of dictionary lookups and suggestions, since the same words recur across files.
+        self._check_cache = {}
+        self._suggest_cache = {}
 
-        # TODO: Consider breaking apart WikiWords instead of filtering them out.
-        self.tokeniser = get_tokenizer(
-            self.dictionary.tag, [EmailFilter, URLFilter, WikiWordFilter, HashBangFilter]
-        )
+        self.tokeniser = get_spelling_tokeniser(self.dictionary)
+
+    @staticmethod
+    def _compile_patterns(patterns):
+        """Compile a list of glob patterns into a single regular expression.
+
+        :param patterns: List of glob patterns.
+        :returns: The compiled pattern, or ``None`` for an empty list.
+        """
+        if not patterns:
+            return None
+        return re.compile('|'.join(
+            '(?:%s)' % fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns
+        ))
 
     def _search_files(self):
         """Generator function which returns files to be checked."""
+        ignore_match = self._ignore_re.match if self._ignore_re else None
+        ignore_dir_match = self._ignore_dir_re.match if self._ignore_dir_re else None
         for root, dirs, files in os.walk(self.base_dir):
+            if ignore_dir_match is not None:
+                # Prune ignored directories to avoid descending into them.
+                dirs[:] = [
+                    name for name in dirs
+                    if not ignore_dir_match(os.path.normcase(os.path.join(root, name)))
+                ]
             for name in files:
                 filename = os.path.join(root, name)
-                if any([fnmatch.fnmatch(filename, i) for i in self.ignore_patterns]):
+                if ignore_match is not None and ignore_match(os.path.normcase(filename)):
+                    continue
+                # Skip files that Pygments has no lexer for.
+                if not self.force_guess and not _has_known_lexer(name):
                     continue
                 yield filename
 
@@ -381,36 +748,105 @@ class BaseChecker(object):
         """
         for name in self._search_files():
             try:
-                self._process_file(
-                    SourceFile(name, self.dictionary, self.tokeniser, self.base_dir, self.encoding)
+                ret_code, message = check_source_file(
+                    self._process_file, name, self.dictionary, self.tokeniser, self.base_dir,
+                    self.encoding, self._check_cache, self._suggest_cache
                 )
-            except pygments.util.ClassNotFound:
-                self.ret_code = 1
-                continue
-            except ParseError as e:
-                print(e, file=sys.stderr)
-                self.ret_code = 1
-                continue
-            except UnicodeDecodeError:
-                self.ret_code = 1
-                continue
-            except (EmptyFileError, NextFile):
-                continue  # Skip empty files
             except StopIteration:  # User quit.
                 break
+            self.ret_code |= ret_code
+            if message is not None:
+                print(message, file=sys.stderr)
         return self.ret_code
 
 
+# Per-process state for the worker processes used by :class:`SpellChecker`.
+_worker_state = {}
+
+
+def _init_worker(language, project_dict):
+    """Initialise the dictionary and tokeniser in a worker process.
+
+    :param language: ISO language code, e.g. 'en_GB' or 'en_US'
+    :param project_dict: Absolute path to the project dictionary.
+    """
+    dictionary = get_dictionary(language, project_dict)
+    _worker_state['dictionary'] = dictionary
+    _worker_state['tokeniser'] = get_spelling_tokeniser(dictionary)
+    _worker_state['check_cache'] = {}
+
+
+def _check_file(args):
+    """Check a single file in a worker process.
+
+    The results are returned as plain tuples so they can be sent back
+    to the parent process.
+
+    :param args: A tuple of (filename, base_dir, encoding).
+    :returns: A tuple of the return code, the list of errors as
+              (filename, line_no, column, word) tuples and an
+              error message to print, or ``None``.
+    """
+    (name, base_dir, encoding) = args
+    errors = []
+    ret_code, message = check_source_file(
+        lambda src_file: errors.extend(src_file.errors_lite()), name,
+        _worker_state['dictionary'], _worker_state['tokeniser'], base_dir, encoding,
+        _worker_state['check_cache']
+    )
+    if errors:
+        ret_code = 1
+    return (ret_code, errors, message)
+
+
 class SpellChecker(BaseChecker):
     """Non-Interactive spell checker. Prints a list of
     all spelling errors found.
+
+    :param jobs: Number of worker processes to check files with.
     """
 
+    def __init__(self, base_dir='.', ignore_patterns=None, language='en_GB',
+                 project_dict=None, encoding='utf-8', force_guess=False, jobs=1):
+        BaseChecker.__init__(self, base_dir, ignore_patterns, language, project_dict, encoding,
+                             force_guess)
+        self.jobs = jobs
+
+    def run(self):
+        """Runs the checker, using a pool of worker processes
+        if more than one job is requested.
+
+        :returns: The script exit code.
+        :rtype: int
+        """
+        if self.jobs <= 1:
+            return BaseChecker.run(self)
+
+        pool = multiprocessing.Pool(self.jobs, _init_worker, (self.language, self.project_dict))
+        try:
+            tasks = ((name, self.base_dir, self.encoding) for name in self._search_files())
+            for ret_code, errors, message in pool.imap(_check_file, tasks, chunksize=8):
+                self.ret_code |= ret_code
+                # Print in the same order as the serial checker.
+                for error in errors:
+                    print(ERROR_FORMAT % error, file=sys.stderr)
+                if message is not None:
+                    print(message, file=sys.stderr)
+        except BaseException:
+            # Stop the workers, rather than waiting for the remaining files.
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+        return self.ret_code
+
     def _process_file(self, src_file):
         """Prints errors to stderr and sets the error flag."""
-        for error in src_file.errors():
+        for error in src_file.errors_lite():
             self.ret_code = 1
-            print(error, file=sys.stderr)
+            print(ERROR_FORMAT % error, file=sys.stderr)
 
 
 class InteractiveChecker(BaseChecker):
@@ -419,6 +855,8 @@ class InteractiveChecker(BaseChecker):
     the excluded words dictionary.
     """
 
+    _split_re = re.compile(r'(\W+)')
+
     def _print_options(self):
         """Prints the list of keyboard options."""
         codes = OrderedDict([
@@ -453,10 +891,11 @@ class InteractiveChecker(BaseChecker):
                 correction = True
             except IndexError:
                 print("%sInvalid selection, please try again.%s" % (Back.RED, Style.RESET_ALL))
-                return self._handle_response(error)
+                return self._handle_response(src_map, error)
         # Add word to the excluded words list
         elif response == "a":
             self.dictionary.add(error.word)
+            self._check_cache[error.word] = True
         # Next file
         elif response == "n":
             raise NextFile()
@@ -487,7 +926,7 @@ class InteractiveChecker(BaseChecker):
 
         if write_file:
             with codecs.open(src_file.filename, 'w', self.encoding) as out_file:
-                out_file.write(u''.join(src_map.values()))
+                out_file.writelines(src_map.values())
 
     def _get_source_map(self, contents):
         """Creates a map of index, token pairs from the source
@@ -500,7 +939,7 @@ class InteractiveChecker(BaseChecker):
         src_map = OrderedDict()
         offset = 0
 
-        for token in re.split(r'(\W+)', contents):
+        for token in self._split_re.split(contents):
             if token == '':
                 continue
             src_map[offset] = token
@@ -532,6 +971,14 @@ def get_parser(description=''):
         '--excluded-words', '-e', default='.excluded-words', help='Path to excluded words list'
     )
     parser.add_argument('--encoding', '-E', default='utf-8', help='Character encoding to use')
+    parser.add_argument(
+        '--force-guess', '-g', default=False, action='store_true',
+        help='Check files with unknown extensions, by guessing the lexer'
+    )
+    parser.add_argument(
+        '--jobs', '-j', default=1, type=int,
+        help='Number of files to check in parallel (ignored in interactive mode)'
+    )
     parser.add_argument('--version', '-v', default=False, action='store_true', help='Print version')
 
     return parser
@@ -547,9 +994,13 @@ def main():
         print("Version: %s" % _get_version())
     else:
         init()  # Initialise colorama
-        checker_class = InteractiveChecker if args.interactive else SpellChecker
-        checker = checker_class(args.directory, args.ignore_patterns, args.language,
-                                args.excluded_words, args.encoding)
+        if args.interactive:
+            checker = InteractiveChecker(args.directory, args.ignore_patterns, args.language,
+                                         args.excluded_words, args.encoding, args.force_guess)
+        else:
+            checker = SpellChecker(args.directory, args.ignore_patterns, args.language,
+                                   args.excluded_words, args.encoding, args.force_guess,
+                                   args.jobs)
         sys.exit(checker.run())
 
 